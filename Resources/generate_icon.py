@@ -5,30 +5,142 @@ Creates a patterns-themed icon with geometric shapes
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import multiprocessing
+import hashlib
+import math
+import numpy as np
 import os
 
+# Color scheme - blue gradient with white patterns
+GRADIENT_START = (58, 123, 213)   # iOS blue
+GRADIENT_END = (88, 86, 214)      # Purple-blue
+PATTERN_COLOR = (255, 255, 255)   # White
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _composite2(base, a, b, out):
+        """Porter-Duff src-over of two overlays onto base in one pass"""
+        height, width = base.shape[:2]
+        for y in prange(height):
+            for x in range(width):
+                dr = base[y, x, 0] / 255.0
+                dg = base[y, x, 1] / 255.0
+                db = base[y, x, 2] / 255.0
+                da = base[y, x, 3] / 255.0
+                for overlay in (a, b):
+                    sa = overlay[y, x, 3] / 255.0
+                    out_a = sa + da * (1 - sa)
+                    if out_a > 0:
+                        dr = (overlay[y, x, 0] / 255.0 * sa + dr * da * (1 - sa)) / out_a
+                        dg = (overlay[y, x, 1] / 255.0 * sa + dg * da * (1 - sa)) / out_a
+                        db = (overlay[y, x, 2] / 255.0 * sa + db * da * (1 - sa)) / out_a
+                    da = out_a
+                out[y, x, 0] = int(dr * 255 + 0.5)
+                out[y, x, 1] = int(dg * 255 + 0.5)
+                out[y, x, 2] = int(db * 255 + 0.5)
+                out[y, x, 3] = int(da * 255 + 0.5)
+
+def _composite_overlays(img, pattern, glow):
+    """Composite the pattern and glow overlays over the base image"""
+    if HAVE_NUMBA:
+        # One fused pass instead of full-size intermediate images
+        out = np.empty((img.height, img.width, 4), np.uint8)
+        _composite2(np.asarray(img), np.asarray(pattern),
+                    np.asarray(glow), out)
+        return Image.fromarray(out, 'RGBA')
+
+    img = Image.alpha_composite(img, pattern)
+    return Image.alpha_composite(img, glow)
+
+# Node angle sets are the same for every size; precompute the trig once
+_OUTER_ANGLES = [0, 60, 120, 180, 240, 300]
+_INNER_ANGLES = [30, 90, 150, 210, 270, 330]
+_OUTER_COS_SIN = [(math.cos(math.radians(a)), math.sin(math.radians(a)))
+                  for a in _OUTER_ANGLES]
+_INNER_COS_SIN = [(math.cos(math.radians(a)), math.sin(math.radians(a)))
+                  for a in _INNER_ANGLES]
+
+# Master render shared with worker processes, set by _init_pool
+_master = None
+
+def _init_pool(master_bytes, master_size):
+    """Reconstruct the master render in each worker process"""
+    global _master
+    _master = Image.frombytes('RGBA', master_size, master_bytes)
+
+def _render_key(size):
+    """Fingerprint of the parameters that determine an icon's pixels"""
+    params = f"{size}|{GRADIENT_START}|{GRADIENT_END}|{PATTERN_COLOR}"
+    return hashlib.blake2b(params.encode()).hexdigest()
+
+def _save_size(path, size):
+    """Resize the master to the requested size and save it
+
+    Skips the PNG encode when the output already exists and its sidecar
+    .cache file records the same render parameters.
+    """
+    key = _render_key(size)
+    cache_path = path + '.cache'
+
+    if os.path.exists(path):
+        try:
+            with open(cache_path) as f:
+                if f.read().strip() == key:
+                    return
+        except OSError:
+            pass
+
+    if size == _master.width:
+        # The master goes to the App Store; spend the time on full deflate
+        _master.save(path, 'PNG', compress_level=9)
+    else:
+        # Smaller sizes are recompressed by Xcode at archive time anyway,
+        # so a light deflate pass is plenty
+        icon = _master.resize((size, size), Image.LANCZOS)
+        icon.save(path, 'PNG', optimize=False, compress_level=1)
+
+    with open(cache_path, 'w') as f:
+        f.write(key)
+
+@functools.lru_cache(maxsize=None)
+def _corner_mask(size):
+    """Rounded-corner mask for iOS icons, cached per size"""
+    mask = Image.new('L', (size, size), 0)
+    mask_draw = ImageDraw.Draw(mask)
+
+    # iOS icon corner radius is ~22.37% of icon size
+    corner_radius = int(size * 0.2237)
+    mask_draw.rounded_rectangle(
+        [(0, 0), (size, size)],
+        radius=corner_radius,
+        fill=255
+    )
+    return mask
+
 def create_gradient_background(size, color1, color2):
     """Create a gradient background"""
-    base = Image.new('RGB', size, color1)
-    draw = ImageDraw.Draw(base)
-
-    for y in range(size[1]):
-        r = int(color1[0] + (color2[0] - color1[0]) * y / size[1])
-        g = int(color1[1] + (color2[1] - color1[1]) * y / size[1])
-        b = int(color1[2] + (color2[2] - color1[2]) * y / size[1])
-        draw.line([(0, y), (size[0], y)], fill=(r, g, b))
+    # Interpolate one column of colors, then broadcast it across the width -
+    # much faster than drawing the gradient line by line
+    t = np.arange(size[1], dtype=np.float32)[:, None] / size[1]
+    rgb = (np.asarray(color1, np.float32) * (1 - t)
+           + np.asarray(color2, np.float32) * t).astype(np.uint8)
 
-    return base
+    arr = np.broadcast_to(rgb[:, None, :], (size[1], size[0], 3)).copy()
+    return Image.fromarray(arr, 'RGB')
 
-def draw_pattern_circles(draw, size, color, alpha=255):
-    """Draw circular pattern elements"""
+def draw_pattern_circles(overlay_draw, size, color, alpha=255):
+    """Draw circular pattern elements onto the shared overlay"""
     width, height = size
     center_x, center_y = width // 2, height // 2
 
-    # Create overlay for alpha
-    overlay = Image.new('RGBA', size, (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
-
     # Main brain-like pattern with circles
     radius_base = min(width, height) // 6
 
@@ -40,14 +152,11 @@ def draw_pattern_circles(draw, size, color, alpha=255):
     )
 
     # Surrounding circles (neural network pattern)
-    angles = [0, 60, 120, 180, 240, 300]
     offset = radius_base * 1.8
 
-    for angle in angles:
-        import math
-        rad = math.radians(angle)
-        x = center_x + offset * math.cos(rad)
-        y = center_y + offset * math.sin(rad)
+    for cos_a, sin_a in _OUTER_COS_SIN:
+        x = center_x + offset * cos_a
+        y = center_y + offset * sin_a
         r = radius_base * 0.7
 
         overlay_draw.ellipse(
@@ -56,10 +165,9 @@ def draw_pattern_circles(draw, size, color, alpha=255):
         )
 
     # Smaller connecting circles
-    for angle in [30, 90, 150, 210, 270, 330]:
-        rad = math.radians(angle)
-        x = center_x + offset * 0.6 * math.cos(rad)
-        y = center_y + offset * 0.6 * math.sin(rad)
+    for cos_a, sin_a in _INNER_COS_SIN:
+        x = center_x + offset * 0.6 * cos_a
+        y = center_y + offset * 0.6 * sin_a
         r = radius_base * 0.4
 
         overlay_draw.ellipse(
@@ -67,26 +175,17 @@ def draw_pattern_circles(draw, size, color, alpha=255):
             fill=(*color, alpha)
         )
 
-    return overlay
-
-def draw_connecting_lines(draw, size, color, alpha=180):
-    """Draw connecting lines between pattern elements"""
+def draw_connecting_lines(overlay_draw, size, color, alpha=180):
+    """Draw connecting lines between pattern elements onto the shared overlay"""
     width, height = size
     center_x, center_y = width // 2, height // 2
 
-    overlay = Image.new('RGBA', size, (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
-
     radius_base = min(width, height) // 6
     offset = radius_base * 1.8
 
-    angles = [0, 60, 120, 180, 240, 300]
-
-    for i, angle in enumerate(angles):
-        import math
-        rad = math.radians(angle)
-        x1 = center_x + offset * math.cos(rad)
-        y1 = center_y + offset * math.sin(rad)
+    for i, (cos_a, sin_a) in enumerate(_OUTER_COS_SIN):
+        x1 = center_x + offset * cos_a
+        y1 = center_y + offset * sin_a
 
         # Connect to center
         overlay_draw.line(
@@ -96,10 +195,9 @@ def draw_connecting_lines(draw, size, color, alpha=180):
         )
 
         # Connect to next circle
-        next_angle = angles[(i + 1) % len(angles)]
-        next_rad = math.radians(next_angle)
-        x2 = center_x + offset * math.cos(next_rad)
-        y2 = center_y + offset * math.sin(next_rad)
+        next_cos, next_sin = _OUTER_COS_SIN[(i + 1) % len(_OUTER_COS_SIN)]
+        x2 = center_x + offset * next_cos
+        y2 = center_y + offset * next_sin
 
         overlay_draw.line(
             [(x1, y1), (x2, y2)],
@@ -107,62 +205,38 @@ def draw_connecting_lines(draw, size, color, alpha=180):
             width=max(2, width // 200)
         )
 
-    return overlay
-
 def create_icon(size):
     """Create the app icon at specified size"""
-    # Color scheme - blue gradient with white patterns
-    gradient_start = (58, 123, 213)   # iOS blue
-    gradient_end = (88, 86, 214)      # Purple-blue
-    pattern_color = (255, 255, 255)   # White
-
     # Create base with gradient
-    img = create_gradient_background((size, size), gradient_start, gradient_end)
+    img = create_gradient_background((size, size), GRADIENT_START, GRADIENT_END)
     img = img.convert('RGBA')
 
-    draw = ImageDraw.Draw(img)
-
-    # Add connecting lines
-    lines_overlay = draw_connecting_lines(draw, (size, size), pattern_color, alpha=150)
-    img = Image.alpha_composite(img, lines_overlay)
-
-    # Add pattern circles
-    circles_overlay = draw_pattern_circles(draw, (size, size), pattern_color, alpha=230)
-    img = Image.alpha_composite(img, circles_overlay)
-
-    # Add subtle glow effect
-    glow_overlay = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    glow_draw = ImageDraw.Draw(glow_overlay)
-    center_x, center_y = size // 2, size // 2
-
-    # Radial glow
-    for i in range(20):
-        alpha = int(30 - i * 1.5)
-        radius = size // 2 - i * 5
-        glow_draw.ellipse(
-            [center_x - radius, center_y - radius,
-             center_x + radius, center_y + radius],
-            fill=(255, 255, 255, alpha)
-        )
+    # One shared overlay for lines and circles instead of an RGBA
+    # allocation per helper; lines first so the circles cover them
+    pattern_overlay = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    overlay_draw = ImageDraw.Draw(pattern_overlay)
 
-    img = Image.alpha_composite(img, glow_overlay)
+    draw_connecting_lines(overlay_draw, (size, size), PATTERN_COLOR, alpha=150)
+    draw_pattern_circles(overlay_draw, (size, size), PATTERN_COLOR, alpha=230)
 
-    # Add rounded corners for iOS icon
-    mask = Image.new('L', (size, size), 0)
-    mask_draw = ImageDraw.Draw(mask)
+    # Subtle glow effect - radial alpha ramp computed in one NumPy
+    # pass, matching the old stepped 20-ellipse overdraw
+    center = size // 2
+    ys, xs = np.ogrid[:size, :size]
+    r = np.sqrt((xs - center)**2 + (ys - center)**2)
+    steps = np.clip((center - r) // 5, 0, 19)
+    alpha = np.where(r <= center, 30 - steps * 1.5, 0).astype(np.uint8)
 
-    # iOS icon corner radius is ~22.37% of icon size
-    corner_radius = int(size * 0.2237)
-    mask_draw.rounded_rectangle(
-        [(0, 0), (size, size)],
-        radius=corner_radius,
-        fill=255
-    )
+    white = np.full((size, size), 255, np.uint8)
+    glow_overlay = Image.fromarray(np.dstack([white, white, white, alpha]), 'RGBA')
+
+    # Blend everything over the gradient in a single composite
+    img = _composite_overlays(img, pattern_overlay, glow_overlay)
 
-    # Apply mask
+    # Apply rounded corners for iOS icon
     output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     output.paste(img, (0, 0))
-    output.putalpha(mask)
+    output.putalpha(_corner_mask(size))
 
     return output
 
@@ -191,10 +265,22 @@ def main():
     print("Generating Behavior Tracker app icons...")
     print(f"Output directory: {output_dir}")
 
-    for filename, size in sizes.items():
-        print(f"Creating {filename} ({size}x{size})")
-        icon = create_icon(size)
-        icon.save(os.path.join(output_dir, filename))
+    # Render once at full resolution and downsample for the smaller sizes -
+    # the 1024 render dominates and LANCZOS resizing is nearly free
+    master = create_icon(1024)
+
+    # Resize and PNG-encode the individual sizes in parallel
+    # Spawned (not forked) workers: forking after the numba kernel has
+    # started its thread pool can deadlock, and macOS spawns by default
+    with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_pool,
+                             initargs=(master.tobytes(), master.size)) as pool:
+        futures = []
+        for filename, size in sizes.items():
+            print(f"Creating {filename} ({size}x{size})")
+            futures.append(pool.submit(_save_size, os.path.join(output_dir, filename), size))
+        for future in futures:
+            future.result()
 
     print("\nIcon generation complete!")
     print(f"\nMain icon: patterns-1024.png (for App Store)")
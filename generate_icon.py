@@ -5,81 +5,92 @@ Generate ASD Behavior Tracker app icon with rainbow infinity symbol on purple ba
 
 from PIL import Image, ImageDraw
 import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fill_radial(out, center_x, center_y, inv_radius, color1, color2):
+        """Fill out with a radial gradient in one multithreaded pass"""
+        height, width = out.shape[:2]
+        for y in prange(height):
+            for x in range(width):
+                ratio = math.sqrt((x - center_x)**2 + (y - center_y)**2) * inv_radius
+                for i in range(3):
+                    out[y, x, i] = int(color1[i] * (1 - ratio) + color2[i] * ratio)
 
 def create_gradient_background(size, color1, color2):
     """Create a radial gradient background"""
-    base = Image.new('RGB', (size, size), color1)
-    draw = ImageDraw.Draw(base)
-
-    # Create radial gradient
     center_x, center_y = size // 2, size // 2
     max_radius = math.sqrt(center_x**2 + center_y**2)
 
-    for y in range(size):
-        for x in range(size):
-            # Calculate distance from center
-            distance = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-            ratio = distance / max_radius
+    if HAVE_NUMBA:
+        # Single fused pass, no intermediate distance/channel arrays
+        out = np.empty((size, size, 3), np.uint8)
+        _fill_radial(out, center_x, center_y, 1.0 / max_radius, color1, color2)
+        return Image.fromarray(out, 'RGB')
 
-            # Interpolate colors
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
+    # Distance field from center, normalized to [0, 1]
+    ys, xs = np.ogrid[:size, :size]
+    ratio = np.sqrt((xs - center_x)**2 + (ys - center_y)**2) / max_radius
 
-            base.putpixel((x, y), (r, g, b))
+    # Interpolate colors across the whole image at once
+    channels = [
+        (color1[i] * (1 - ratio) + color2[i] * ratio).astype(np.uint8)
+        for i in range(3)
+    ]
 
-    return base
+    return Image.fromarray(np.dstack(channels), 'RGB')
 
 def draw_infinity_symbol(draw, center_x, center_y, width, height, num_points=200):
     """
     Draw infinity symbol and return points for coloring
     The infinity symbol is a lemniscate: x = a*cos(t), y = a*sin(t)*cos(t)
     """
-    points = []
     a = width / 2  # Scale factor
     b = height / 2
 
-    for i in range(num_points):
-        t = (2 * math.pi * i) / num_points
-
-        # Lemniscate parametric equations
-        denominator = 1 + math.sin(t)**2
-        x = center_x + (a * math.cos(t)) / denominator
-        y = center_y + (b * math.sin(t) * math.cos(t)) / denominator
-
-        points.append((x, y))
-
-    return points
+    # Lemniscate parametric equations, evaluated for all t at once
+    t = np.linspace(0, 2 * np.pi, num_points, endpoint=False)
+    sin_t = np.sin(t)
+    cos_t = np.cos(t)
+    denominator = 1 + sin_t**2
+
+    xs = center_x + (a * cos_t) / denominator
+    ys = center_y + (b * sin_t * cos_t) / denominator
+
+    return np.column_stack([xs, ys])
+
+# Rainbow: Red -> Orange -> Yellow -> Green -> Blue -> Indigo -> Violet
+RAINBOW_COLORS = [
+    (255, 0, 0),      # Red
+    (255, 127, 0),    # Orange
+    (255, 255, 0),    # Yellow
+    (0, 255, 0),      # Green
+    (0, 127, 255),    # Blue
+    (75, 0, 130),     # Indigo
+    (148, 0, 211),    # Violet
+]
+
+def _build_rainbow_lut(entries=1024):
+    """Precompute the rainbow interpolation as a lookup table"""
+    positions = np.linspace(0, 1, entries)
+    stops = np.linspace(0, 1, len(RAINBOW_COLORS))
+    return np.column_stack([
+        np.interp(positions, stops, [c[i] for c in RAINBOW_COLORS])
+        for i in range(3)
+    ]).astype(np.uint8)
+
+RAINBOW_LUT = _build_rainbow_lut()
 
 def get_rainbow_color(position):
     """Get rainbow color based on position (0.0 to 1.0)"""
-    # Rainbow: Red -> Orange -> Yellow -> Green -> Blue -> Indigo -> Violet
-    colors = [
-        (255, 0, 0),      # Red
-        (255, 127, 0),    # Orange
-        (255, 255, 0),    # Yellow
-        (0, 255, 0),      # Green
-        (0, 127, 255),    # Blue
-        (75, 0, 130),     # Indigo
-        (148, 0, 211),    # Violet
-    ]
-
-    # Determine which two colors to interpolate between
-    scaled_pos = position * (len(colors) - 1)
-    idx = int(scaled_pos)
-    if idx >= len(colors) - 1:
-        return colors[-1]
-
-    # Interpolate between two adjacent colors
-    ratio = scaled_pos - idx
-    c1 = colors[idx]
-    c2 = colors[idx + 1]
-
-    r = int(c1[0] * (1 - ratio) + c2[0] * ratio)
-    g = int(c1[1] * (1 - ratio) + c2[1] * ratio)
-    b = int(c1[2] * (1 - ratio) + c2[2] * ratio)
-
-    return (r, g, b)
+    return tuple(int(c) for c in RAINBOW_LUT[int(position * (len(RAINBOW_LUT) - 1))])
 
 def create_app_icon(output_path, size=1024):
     """Create the app icon"""
@@ -103,27 +114,24 @@ def create_app_icon(output_path, size=1024):
     # Draw the infinity symbol with thick rainbow-colored lines
     line_width = int(size * 0.08)  # Thick line
 
-    for i in range(len(points) - 1):
-        # Get rainbow color based on position along the curve
-        position = i / len(points)
-        color = get_rainbow_color(position)
-
-        # Draw thick line segment
-        x1, y1 = points[i]
-        x2, y2 = points[i + 1]
-
-        # Draw multiple lines to create thickness
-        for offset in range(-line_width//2, line_width//2):
-            draw.line(
-                [(x1, y1 + offset), (x2, y2 + offset)],
-                fill=color,
-                width=3
-            )
-            draw.line(
-                [(x1 + offset, y1), (x2 + offset, y2)],
-                fill=color,
-                width=3
-            )
+    # Group consecutive segments that quantize to the same rainbow LUT
+    # entry and stroke each run once; PIL renders the thickness natively
+    lut_indices = (np.arange(len(points) - 1) / len(points)
+                   * (len(RAINBOW_LUT) - 1)).astype(int)
+
+    radius = line_width / 2
+    start = 0
+    for i in range(1, len(lut_indices) + 1):
+        if i == len(lut_indices) or lut_indices[i] != lut_indices[start]:
+            color = tuple(int(c) for c in RAINBOW_LUT[lut_indices[start]])
+            run = [tuple(p) for p in points[start:i + 1]]
+            draw.line(run, fill=color, width=line_width, joint='curve')
+
+            # Round caps so adjacent runs meet without gaps
+            for x, y in (run[0], run[-1]):
+                draw.ellipse([x - radius, y - radius, x + radius, y + radius],
+                             fill=color)
+            start = i
 
     # Add rounded corners for iOS app icon style
     mask = Image.new('L', (size, size), 0)